@@ -29,7 +29,7 @@ esac
 
 check_port() {
     local port="$1"
-    bash -c "</dev/tcp/127.0.0.1/${port}" >/dev/null 2>&1
+    (: <"/dev/tcp/127.0.0.1/${port}") >/dev/null 2>&1
 }
 
 echo "=== Container Status ==="
@@ -11,10 +11,10 @@ import json
 import os
 import sys
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from mcp.client.session import ClientSession
-from mcp.client.stdio import StdioServerParameters, stdio_client
+if TYPE_CHECKING:
+    from mcp.client.stdio import StdioServerParameters
 
 
 def get_repo_dir() -> Path:
@@ -68,6 +68,8 @@ def parse_args() -> argparse.Namespace:
 
 
 def build_server_params(args: argparse.Namespace) -> StdioServerParameters:
+    from mcp.client.stdio import StdioServerParameters
+
     repo_dir = get_repo_dir()
     env = {
         "HOME": os.environ.get("HOME", ""),
@@ -106,6 +108,9 @@ def require_success(result: Any, label: str) -> dict[str, Any]:
 
 
 async def verify(args: argparse.Namespace) -> dict[str, Any]:
+    from mcp.client.session import ClientSession
+    from mcp.client.stdio import stdio_client
+
     server = build_server_params(args)
     summary: dict[str, Any] = {
         "mode": "ssh" if args.ssh_target else "local",
@@ -138,6 +143,12 @@ async def verify(args: argparse.Namespace) -> dict[str, Any]:
                 }
 
                 if args.gateway_checks:
+                    underlying = {
+                        "symbol": args.underlying_symbol,
+                        "securityType": "STK",
+                        "exchange": "SMART",
+                        "currency": "USD",
+                    }
                     health = require_success(await session.call_tool("ibkr_health"), "ibkr_health")
                     summary["checks"]["health"] = {
                         "status": health["status"],
@@ -151,12 +162,7 @@ async def verify(args: argparse.Namespace) -> dict[str, Any]:
                             "ibkr_preview_order",
                             {
                                 "order": {
-                                    "instrument": {
-                                        "symbol": args.underlying_symbol,
-                                        "securityType": "STK",
-                                        "exchange": "SMART",
-                                        "currency": "USD",
-                                    },
+                                    "instrument": underlying,
                                     "side": "BUY",
                                     "quantity": 1,
                                     "orderType": "MKT",
@@ -174,12 +180,7 @@ async def verify(args: argparse.Namespace) -> dict[str, Any]:
                         await session.call_tool(
                             "ibkr_get_option_chain",
                             {
-                                "underlying": {
-                                    "symbol": args.underlying_symbol,
-                                    "securityType": "STK",
-                                    "exchange": "SMART",
-                                    "currency": "USD",
-                                },
+                                "underlying": underlying,
                                 "strike_count": 1,
                                 "max_candidates": 1,
                             },
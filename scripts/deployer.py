@@ -2,7 +2,6 @@ import os
 import subprocess
 import json
 import typer
-from dotenv import load_dotenv, set_key
 from pathlib import Path
 
 app = typer.Typer(help="Agent-focused IB Gateway Deployer")
@@ -14,7 +13,12 @@ ENV_FILE = ROOT_DIR / ".env"
 def check():
     """Check if Docker is running and required ports are available."""
     try:
-        subprocess.run(["docker", "info"], check=True, capture_output=True)
+        subprocess.run(
+            ["docker", "info"],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
         typer.echo(json.dumps({"docker": "running"}))
     except subprocess.CalledProcessError:
         typer.echo(json.dumps({"docker": "not running", "error": "Docker daemon is not responsive."}))
@@ -23,13 +27,16 @@ def check():
 @app.command()
 def setup():
     """Setup environment variables interactively if missing."""
+    from dotenv import dotenv_values, set_key
+
     if not ENV_FILE.exists():
         ENV_FILE.touch()
     
-    load_dotenv(ENV_FILE)
-    userid = os.environ.get("TWS_USERID")
-    password = os.environ.get("TWS_PASSWORD")
-    mode = os.environ.get("TRADING_MODE", "paper")
+    file_values = {k: v for k, v in dotenv_values(ENV_FILE).items() if v is not None}
+    env = {**file_values, **os.environ}
+    userid = env.get("TWS_USERID")
+    password = env.get("TWS_PASSWORD")
+    mode = env.get("TRADING_MODE", "paper")
     
     if not userid:
         userid = typer.prompt("Enter TWS_USERID")
@@ -38,32 +45,32 @@ def setup():
         password = typer.prompt("Enter TWS_PASSWORD", hide_input=True)
         set_key(str(ENV_FILE), "TWS_PASSWORD", password)
     
-    set_key(str(ENV_FILE), "TRADING_MODE", mode)
+    if file_values.get("TRADING_MODE") != mode:
+        set_key(str(ENV_FILE), "TRADING_MODE", mode)
     typer.echo(json.dumps({"status": "setup complete", "env_file": str(ENV_FILE)}))
 
-@app.command()
-def up(detach: bool = True):
-    """Start the IB Gateway container via docker compose."""
-    cmd = ["docker", "compose", "up"]
-    if detach:
-        cmd.append("-d")
-    
+def _compose(*args: str) -> None:
+    """Run a docker compose subcommand, reporting failure as JSON and exiting."""
     try:
-        subprocess.run(cmd, cwd=ROOT_DIR, check=True)
-        typer.echo(json.dumps({"status": "started", "container": "ib-gateway"}))
+        subprocess.run(["docker", "compose", *args], cwd=ROOT_DIR, check=True)
     except subprocess.CalledProcessError as e:
         typer.echo(json.dumps({"status": "failed", "error": str(e)}))
         raise typer.Exit(1)
 
+@app.command()
+def up(detach: bool = True):
+    """Start the IB Gateway container via docker compose."""
+    args = ["up"]
+    if detach:
+        args.append("-d")
+    _compose(*args)
+    typer.echo(json.dumps({"status": "started", "container": "ib-gateway"}))
+
 @app.command()
 def down():
     """Stop the IB Gateway container."""
-    try:
-        subprocess.run(["docker", "compose", "down"], cwd=ROOT_DIR, check=True)
-        typer.echo(json.dumps({"status": "stopped", "container": "ib-gateway"}))
-    except subprocess.CalledProcessError as e:
-        typer.echo(json.dumps({"status": "failed", "error": str(e)}))
-        raise typer.Exit(1)
+    _compose("down")
+    typer.echo(json.dumps({"status": "stopped", "container": "ib-gateway"}))
 
 @app.command()
 def status():
@@ -72,7 +79,7 @@ def status():
         res = subprocess.run(
             ["docker", "compose", "ps", "--format", "json"], 
             cwd=ROOT_DIR, 
-            capture_output=True, 
+            capture_output=True,
             text=True,
             check=True
         )